@@ -1,4 +1,5 @@
 from effect.effect import Effect as Effect
+from effect.effect import pure as pure
 from effect.identity import (
     IdentifiedValue as IdentifiedValue,
 )
@@ -1,7 +1,6 @@
 from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
-from itertools import chain
-from typing import Any, Generic, Never, TypeVar, cast
+from typing import Any, Generic, Never, TypeVar
 
 from effect.identity import IdentifiedValue, IdentifiedValueSet, Identity
 from effect.state_transition import (
@@ -9,6 +8,7 @@ from effect.state_transition import (
     MutatedValue,
     NewValue,
     NoValue,
+    TransitionOperand,
     TranslatedValue,
 )
 
@@ -21,8 +21,22 @@ DeadT = TypeVar("DeadT", covariant=True, bound=IdentifiedValue, default=Never)
 JustT = TypeVar("JustT", default=Never)
 
 
+type _AnyValueWithState = (
+    NewValue[Any] | TranslatedValue[Any] | MutatedValue[Any] | DeadValue[Any]
+)
+
+
+class _EffectCaches:
+    # Kept out of the dataclass fields so that they are not compared,
+    # serialized or pickled. Unset until first used.
+    __slots__ = ("_values_cache", "_values_with_state_by_identity_cache")
+
+    _values_cache: IdentifiedValueSet[Any]
+    _values_with_state_by_identity_cache: dict[Identity[Any], _AnyValueWithState]
+
+
 @dataclass(frozen=True, slots=True, eq=False)
-class Effect(Generic[ValueT, NewT, TranslatedT, MutatedT, DeadT]):
+class Effect(_EffectCaches, Generic[ValueT, NewT, TranslatedT, MutatedT, DeadT]):
     just: ValueT
     new_values: IdentifiedValueSet[NewT] = IdentifiedValueSet()
     translated_values: IdentifiedValueSet[TranslatedT] = IdentifiedValueSet()
@@ -61,31 +75,53 @@ class Effect(Generic[ValueT, NewT, TranslatedT, MutatedT, DeadT]):
             | NoValue[Any]
         ]
     ) -> "Effect[_ValueT, _NewT, _TranslatedT, _MutatedT, _DeadT]":
-        values = tuple(values)
+        new_values = list[_NewT]()
+        translated_values = list[_TranslatedT]()
+        mutated_values = list[_MutatedT]()
+        dead_values = list[_DeadT]()
+
+        # Indexed by `ValueWithState.state_tag`.
+        values_by_state_tag: tuple[list[Any], ...] = (
+            new_values,
+            translated_values,
+            mutated_values,
+            dead_values,
+        )
+        no_value_state_tag = NoValue.state_tag
+
+        for value in values:
+            state_tag = value.state_tag
+
+            if state_tag != no_value_state_tag:
+                values_by_state_tag[state_tag].append(value.just)
 
         return Effect(
             just,
-            new_values=IdentifiedValueSet(
-                value.just for value in values if isinstance(value, NewValue)
-            ),
-            translated_values=IdentifiedValueSet(
-                value.just for value in values if isinstance(value, TranslatedValue)
-            ),
-            mutated_values=IdentifiedValueSet(
-                value.just for value in values if isinstance(value, MutatedValue)
-            ),
-            dead_values=IdentifiedValueSet(
-                value.just for value in values if isinstance(value, DeadValue)
-            ),
+            new_values=_identified_value_set(new_values),
+            translated_values=_identified_value_set(translated_values),
+            mutated_values=_identified_value_set(mutated_values),
+            dead_values=_identified_value_set(dead_values),
         )
 
     def __iter__(self) -> Iterator[NewT | TranslatedT | MutatedT | DeadT]:
-        return iter(
-            self.new_values
-            | self.translated_values
-            | self.mutated_values
-            | self.dead_values
+        return iter(self._values)
+
+    @property
+    def _values(self) -> IdentifiedValueSet[NewT | TranslatedT | MutatedT | DeadT]:
+        try:
+            return self._values_cache
+        except AttributeError:
+            pass
+
+        values = IdentifiedValueSet[NewT | TranslatedT | MutatedT | DeadT].union_all(
+            self.new_values,
+            self.translated_values,
+            self.mutated_values,
+            self.dead_values,
         )
+        object.__setattr__(self, "_values_cache", values)  # noqa: PLC2801
+
+        return values
 
     def values_with_state[T](self) -> Iterable[
         NewValue[NewT]
@@ -108,19 +144,16 @@ class Effect(Generic[ValueT, NewT, TranslatedT, MutatedT, DeadT]):
         | DeadValue[DeadT]
         | NoValue[T]
     ):
-        if self.new_values.contains(value):
-            return NewValue(value)
-
-        if self.translated_values.contains(value):
-            return TranslatedValue(value)
-
-        if self.mutated_values.contains(value):
-            return MutatedValue(value)
+        value_with_state = (
+            self._values_with_state_by_identity.get(Identity(value))
+            if isinstance(value, IdentifiedValue)
+            else None
+        )
 
-        if self.dead_values.contains(value):
-            return DeadValue(value)
+        if value_with_state is None:
+            return NoValue(value)
 
-        return NoValue(value)
+        return type(value_with_state)(value)
 
     def value_with_state_by_identity[T: IdentifiedValue](
         self,
@@ -132,23 +165,39 @@ class Effect(Generic[ValueT, NewT, TranslatedT, MutatedT, DeadT]):
         | DeadValue[DeadT]
         | NoValue[T]
     ):
-        for new_value_identity in self.new_values.identities:
-            if identity == new_value_identity:
-                return NewValue(new_value_identity.value)
+        value_with_state = self._values_with_state_by_identity.get(identity)
+
+        if value_with_state is None:
+            return NoValue(identity.value)
 
-        for translated_value_identity in self.translated_values.identities:
-            if identity == translated_value_identity:
-                return TranslatedValue(translated_value_identity.value)
+        return value_with_state
 
-        for mutated_value_identity in self.mutated_values.identities:
-            if identity == mutated_value_identity:
-                return MutatedValue(mutated_value_identity.value)
+    @property
+    def _values_with_state_by_identity(self) -> dict[Identity[Any], _AnyValueWithState]:
+        try:
+            return self._values_with_state_by_identity_cache
+        except AttributeError:
+            pass
 
-        for dead_value_identity in self.dead_values.identities:
-            if identity == dead_value_identity:
-                return DeadValue(dead_value_identity.value)
+        # Sets are visited in reverse order so that an identity occurring in
+        # several of them keeps the earliest state: new, translated, mutated, dead.
+        values_with_state_by_identity: dict[Identity[Any], _AnyValueWithState] = {
+            identity: state(identity.value)
+            for values, state in (
+                (self.dead_values, DeadValue),
+                (self.mutated_values, MutatedValue),
+                (self.translated_values, TranslatedValue),
+                (self.new_values, NewValue),
+            )
+            for identity in values.identities
+        }
+        object.__setattr__(  # noqa: PLC2801
+            self,
+            "_values_with_state_by_identity_cache",
+            values_with_state_by_identity,
+        )
 
-        return NoValue(identity.value)
+        return values_with_state_by_identity
 
     def __and__[
         OtherValueT,
@@ -160,44 +209,36 @@ class Effect(Generic[ValueT, NewT, TranslatedT, MutatedT, DeadT]):
         self,
         right_effect: "Effect[OtherValueT, OtherNewT, OtherTranslatedT, OtherMutatedT, OtherDeadT]",  # noqa: E501
     ) -> "Effect[OtherValueT, NewT | OtherNewT, TranslatedT | OtherTranslatedT, MutatedT | OtherMutatedT, DeadT | OtherDeadT]":  # noqa: E501
-        left_values = IdentifiedValueSet(self)
-        right_values = IdentifiedValueSet(right_effect)
-
-        left_difference = IdentifiedValueSet(self) - IdentifiedValueSet(right_effect)
-        intersection = cast(
-            IdentifiedValueSet[
-                NewT
-                | OtherNewT
-                | TranslatedT
-                | OtherTranslatedT
-                | MutatedT
-                | OtherMutatedT
-                | DeadT
-                | OtherDeadT
-            ],
-            left_values & right_values,
-        )
-        right_difference = IdentifiedValueSet(right_effect) - IdentifiedValueSet(self)
+        # Effects holding an identity in several sets are normalized by the
+        # general path below.
+        if not right_effect._has_values() and self._has_disjoint_values():
+            return self.map(lambda _: right_effect.just)
 
-        next_intersection_values = (
-            (
-                self.value_with_state_by_identity(identity)
-                & right_effect.value_with_state_by_identity(identity)
-            )
-            for identity in intersection.identities
-        )
-        next_left_difference_values = (
-            self.value_with_state_by_value(value)
-            for value in left_difference
-        )
-        next_right_difference_values = (
-            right_effect.value_with_state_by_value(value)
-            for value in right_difference
-        )
-        next_values = chain(
-            next_left_difference_values,
-            next_intersection_values,
-            next_right_difference_values,
+        if not self._has_values() and right_effect._has_disjoint_values():
+            return right_effect
+
+        left_values_with_state = self._values_with_state_by_identity
+        right_values_with_state = right_effect._values_with_state_by_identity
+
+        if self._value_count() == right_effect._value_count() == 1:
+            [left_identity] = left_values_with_state
+            [right_identity] = right_values_with_state
+
+            if left_identity != right_identity:
+                return Effect(
+                    right_effect.just,
+                    new_values=_union(self.new_values, right_effect.new_values),
+                    translated_values=_union(
+                        self.translated_values, right_effect.translated_values
+                    ),
+                    mutated_values=_union(
+                        self.mutated_values, right_effect.mutated_values
+                    ),
+                    dead_values=_union(self.dead_values, right_effect.dead_values),
+                )
+
+        next_values = _combined_values_with_state(
+            left_values_with_state, right_values_with_state
         )
 
         return Effect.of_values_with_state(
@@ -211,6 +252,7 @@ class Effect(Generic[ValueT, NewT, TranslatedT, MutatedT, DeadT]):
         return Effect(
             just=func(self.just),
             new_values=self.new_values,
+            translated_values=self.translated_values,
             mutated_values=self.mutated_values,
             dead_values=self.dead_values,
         )
@@ -228,4 +270,141 @@ class Effect(Generic[ValueT, NewT, TranslatedT, MutatedT, DeadT]):
             "Effect[OtherValueT, OtherNewT, OtherTranslatedT, OtherMutatedT, OtherDeadT]",
         ],
     ) -> "Effect[OtherValueT, NewT | OtherNewT, TranslatedT | OtherTranslatedT, MutatedT | OtherMutatedT, DeadT | OtherDeadT]":  # noqa: E501
+        if getattr(func, "__effect_pure__", False) and _is_hashable(func):
+            return _and_then_pure(self, func)
+
         return self & func(self.just)
+
+    def _has_values(self) -> bool:
+        return bool(
+            self.new_values
+            or self.translated_values
+            or self.mutated_values
+            or self.dead_values
+        )
+
+    def _has_disjoint_values(self) -> bool:
+        return len(self._values_with_state_by_identity) == self._value_count()
+
+    def _value_count(self) -> int:
+        return (
+            len(self.new_values)
+            + len(self.translated_values)
+            + len(self.mutated_values)
+            + len(self.dead_values)
+        )
+
+
+def _is_hashable(value: object) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+
+    return True
+
+
+class UnmarkableFunctionError(TypeError):
+    def __init__(self, func: object) -> None:
+        super().__init__(
+            f"{func!r} can't be marked as pure, mark the function it is made from"
+        )
+
+
+def pure[FuncT: Callable[..., Any]](func: FuncT) -> FuncT:
+    try:
+        setattr(func, "__effect_pure__", True)  # noqa: B010
+    except AttributeError as error:
+        raise UnmarkableFunctionError(func) from error
+
+    return func
+
+
+type _PureAndThenKey = tuple[int, Callable[[Any], Effect[Any, Any, Any, Any, Any]]]
+type _PureAndThenEntry = tuple[
+    Effect[Any, Any, Any, Any, Any], Effect[Any, Any, Any, Any, Any]
+]
+
+# Keyed by the identity of effects rather than by their equality: equal
+# effects may hold values that are equal but not the same, like `1` and `True`.
+# Each entry keeps its effect alive, so its id can't be reused while cached.
+_pure_and_then_entries: dict[_PureAndThenKey, _PureAndThenEntry] = {}
+_max_pure_and_then_entry_count = 256
+
+
+def _and_then_pure(
+    effect: Effect[Any, Any, Any, Any, Any],
+    func: Callable[[Any], Effect[Any, Any, Any, Any, Any]],
+) -> Effect[Any, Any, Any, Any, Any]:
+    key = (id(effect), func)
+    entry = _pure_and_then_entries.pop(key, None)
+
+    if entry is not None and entry[0] is effect:
+        _pure_and_then_entries[key] = entry
+        return entry[1]
+
+    next_effect = effect & func(effect.just)
+    _pure_and_then_entries[key] = (effect, next_effect)
+
+    if len(_pure_and_then_entries) > _max_pure_and_then_entry_count:
+        del _pure_and_then_entries[next(iter(_pure_and_then_entries))]
+
+    return next_effect
+
+
+_no_values = IdentifiedValueSet[Any]()
+
+
+def _identified_value_set[T: IdentifiedValue](
+    values: list[T],
+) -> IdentifiedValueSet[T]:
+    return IdentifiedValueSet(values) if values else _no_values
+
+
+def _union[T: IdentifiedValue](
+    left_values: IdentifiedValueSet[T], right_values: IdentifiedValueSet[T]
+) -> IdentifiedValueSet[T]:
+    if not right_values:
+        return left_values
+
+    if not left_values:
+        return right_values
+
+    return IdentifiedValueSet[T].union_all(left_values, right_values)
+
+
+def _combined_values_with_state(
+    left_values_with_state: dict[Identity[Any], _AnyValueWithState],
+    right_values_with_state: dict[Identity[Any], _AnyValueWithState],
+) -> Iterable[TransitionOperand[Any]]:
+    # The larger map is copied without rehashing, so only identities of the
+    # smaller one are probed.
+    is_left_smaller = len(left_values_with_state) <= len(right_values_with_state)
+
+    if is_left_smaller:
+        smaller_values_with_state = left_values_with_state
+        larger_values_with_state = right_values_with_state
+    else:
+        smaller_values_with_state = right_values_with_state
+        larger_values_with_state = left_values_with_state
+
+    combined_values_with_state = dict[Identity[Any], TransitionOperand[Any]](
+        larger_values_with_state
+    )
+    larger_value_with_state_by = combined_values_with_state.get
+
+    for identity, smaller_value_with_state in smaller_values_with_state.items():
+        larger_value_with_state = larger_value_with_state_by(identity)
+
+        if larger_value_with_state is None:
+            combined_values_with_state[identity] = smaller_value_with_state
+        elif is_left_smaller:
+            combined_values_with_state[identity] = (
+                smaller_value_with_state & larger_value_with_state
+            )
+        else:
+            combined_values_with_state[identity] = (
+                larger_value_with_state & smaller_value_with_state
+            )
+
+    return combined_values_with_state.values()
@@ -1,5 +1,5 @@
 from collections.abc import Iterable, Iterator, Set
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Self, TypeGuard, cast
 
 
@@ -14,18 +14,27 @@ class IdentifiedValue[IdT = Any]:
         return any(self.is_(value) for value in values)
 
 
-@dataclass(frozen=True, eq=False, unsafe_hash=False)
+@dataclass(frozen=True, slots=True, eq=False, unsafe_hash=False)
 class Identity[ValueT: IdentifiedValue = IdentifiedValue]:
     value: ValueT
+    _hash: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        hash_ = hash(type(self.value)) + hash(cast(object, self.value.id))
+        object.__setattr__(self, "_hash", hash_)
 
     def __eq__(self, identity: object, /) -> bool:
-        return (
+        return identity is self or (
             type(identity) is type(self)
             and self.value.is_(cast(Self, identity).value)
         )
 
     def __hash__(self) -> int:
-        return hash(type(self.value)) + hash(cast(object, self.value.id))
+        return self._hash
+
+    def __reduce__(self) -> tuple[type[Self], tuple[ValueT]]:
+        # The hash depends on the process, so it is recomputed on unpickling.
+        return type(self), (self.value,)
 
 
 @dataclass(slots=True, init=False, unsafe_hash=True, repr=False)
@@ -33,7 +42,19 @@ class IdentifiedValueSet[IdentifiedT: IdentifiedValue](Set[IdentifiedT]):
     _identities: frozenset[Identity[IdentifiedT]]
 
     def __init__(self, values: Iterable[IdentifiedT] = tuple()) -> None:
-        self._identities = frozenset({Identity(value) for value in values})
+        if isinstance(values, IdentifiedValueSet):
+            self._identities = values.identities
+        else:
+            self._identities = frozenset({Identity(value) for value in values})
+
+    @classmethod
+    def union_all(cls, *sets: "IdentifiedValueSet[Any]") -> Self:
+        union = cls()
+        union._identities = frozenset[Identity[IdentifiedT]]().union(  # noqa: SLF001
+            *(set_.identities for set_ in sets)
+        )
+
+        return union
 
     @property
     def identities(self) -> frozenset[Identity[IdentifiedT]]:
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Any, ClassVar
+from typing import Any, ClassVar, Never
 
 
 @dataclass(frozen=True, slots=True, repr=False)
@@ -8,13 +9,18 @@ class ValueWithState[JustT = Any](ABC):
     just: JustT
     state_name: ClassVar[str]
 
+    @property
+    @abstractmethod
+    def state_tag(self) -> int: ...
+
     def __repr__(self) -> str:
         return f"{self.state_name}({self.just})"
 
-    @abstractmethod
     def __and__[NextJustT](
         self, next_value: "TransitionOperand[NextJustT]"
-    ) -> "TransitionOperand[JustT | NextJustT]": ...
+    ) -> "TransitionOperand[JustT | NextJustT]":
+        transition = _transitions_by_tags[self.state_tag][next_value.state_tag]
+        return transition(self, next_value)
 
 
 type TransitionOperand[T] = (
@@ -35,84 +41,72 @@ class InvalidStateTransitionError(Exception):
 
 class NoValue[JustT = Any](ValueWithState[JustT]):
     state_name = "no"
-
-    def __and__[NextJustT](
-        self, next_value: "TransitionOperand[NextJustT]"
-    ) -> "TransitionOperand[JustT | NextJustT]":
-        return next_value
+    state_tag = 4
 
 
 class NewValue[JustT = Any](ValueWithState[JustT]):
     state_name = "new"
-
-    def __and__[NextJustT](
-        self, next_value: "TransitionOperand[NextJustT]"
-    ) -> "TransitionOperand[JustT | NextJustT]":
-        match next_value:
-            case NewValue():
-                return next_value
-            case TranslatedValue():
-                raise InvalidStateTransitionError(was=self, became=next_value)
-            case MutatedValue(just):
-                return NewValue(just)
-            case DeadValue(just):
-                return NoValue(just)
-            case NoValue():
-                return self
+    state_tag = 0
 
 
 class TranslatedValue[JustT = Any](ValueWithState[JustT]):
     state_name = "translated"
-
-    def __and__[NextJustT](
-        self, next_value: "TransitionOperand[NextJustT]"
-    ) -> "TransitionOperand[JustT | NextJustT]":
-        match next_value:
-            case NewValue():
-                raise InvalidStateTransitionError(was=self, became=next_value)
-            case TranslatedValue():
-                return next_value
-            case MutatedValue(just):
-                return TranslatedValue(just)
-            case DeadValue(just):
-                return NoValue(just)
-            case NoValue():
-                return self
+    state_tag = 1
 
 
 class MutatedValue[JustT = Any](ValueWithState[JustT]):
     state_name = "mutated"
-
-    def __and__[NextJustT](
-        self, next_value: "TransitionOperand[NextJustT]"
-    ) -> "TransitionOperand[JustT | NextJustT]":
-        match next_value:
-            case NewValue():
-                raise InvalidStateTransitionError(was=self, became=next_value)
-            case TranslatedValue():
-                raise InvalidStateTransitionError(was=self, became=next_value)
-            case MutatedValue():
-                return next_value
-            case DeadValue():
-                return next_value
-            case NoValue():
-                return self
+    state_tag = 2
 
 
 class DeadValue[JustT = Any](ValueWithState[JustT]):
     state_name = "dead"
+    state_tag = 3
 
-    def __and__[NextJustT](
-        self, next_value: "TransitionOperand[NextJustT]"
-    ) -> "TransitionOperand[JustT | NextJustT]":
-        match next_value:
-            case NewValue():
-                raise InvalidStateTransitionError(was=self, became=next_value)
-            case TranslatedValue():
-                raise InvalidStateTransitionError(was=self, became=next_value)
-            case MutatedValue():
-                raise InvalidStateTransitionError(was=self, became=next_value)
-            case DeadValue():
-                return next_value
-            case NoValue():
-                return self
+
+_states_by_tag = (NewValue, TranslatedValue, MutatedValue, DeadValue, NoValue)
+
+
+type _Transition = Callable[[Any, Any], TransitionOperand[Any]]
+
+
+def _invalid(was: TransitionOperand[Any], became: TransitionOperand[Any]) -> Never:
+    raise InvalidStateTransitionError(was=was, became=became)
+
+
+_transitions: dict[tuple[type[ValueWithState], type[ValueWithState]], _Transition] = {
+    (NoValue, NoValue): lambda _, became: became,
+    (NoValue, NewValue): lambda _, became: became,
+    (NoValue, TranslatedValue): lambda _, became: became,
+    (NoValue, MutatedValue): lambda _, became: became,
+    (NoValue, DeadValue): lambda _, became: became,
+
+    (NewValue, NoValue): lambda was, _: was,
+    (NewValue, NewValue): lambda _, became: became,
+    (NewValue, TranslatedValue): _invalid,
+    (NewValue, MutatedValue): lambda _, became: NewValue(became.just),
+    (NewValue, DeadValue): lambda _, became: NoValue(became.just),
+
+    (TranslatedValue, NoValue): lambda was, _: was,
+    (TranslatedValue, NewValue): _invalid,
+    (TranslatedValue, TranslatedValue): lambda _, became: became,
+    (TranslatedValue, MutatedValue): lambda _, became: TranslatedValue(became.just),
+    (TranslatedValue, DeadValue): lambda _, became: NoValue(became.just),
+
+    (MutatedValue, NoValue): lambda was, _: was,
+    (MutatedValue, NewValue): _invalid,
+    (MutatedValue, TranslatedValue): _invalid,
+    (MutatedValue, MutatedValue): lambda _, became: became,
+    (MutatedValue, DeadValue): lambda _, became: became,
+
+    (DeadValue, NoValue): lambda was, _: was,
+    (DeadValue, NewValue): _invalid,
+    (DeadValue, TranslatedValue): _invalid,
+    (DeadValue, MutatedValue): _invalid,
+    (DeadValue, DeadValue): lambda _, became: became,
+}
+
+_transitions_by_tags = tuple(
+    tuple(_transitions[was, became] for became in _states_by_tag)
+    for was in _states_by_tag
+)
@@ -1,11 +1,24 @@
-from dataclasses import dataclass
+from dataclasses import astuple, dataclass, fields
 
 from pytest import fixture, raises
 
-from effect.effect import Effect
-from effect.identity import IdentifiedValue, IdentifiedValueSet
-from effect.state_transition import InvalidStateTransitionError
-from effect.sugar import dead, existing, mutated, new, translated
+from effect.effect import Effect, UnmarkableFunctionError, pure
+from effect.identity import IdentifiedValue, IdentifiedValueSet, Identity
+from effect.state_transition import (
+    InvalidStateTransitionError,
+    MutatedValue,
+    NewValue,
+    NoValue,
+)
+from effect.sugar import (
+    Existing,
+    Mutated,
+    dead,
+    existing,
+    mutated,
+    new,
+    translated,
+)
 
 
 @dataclass(kw_only=True, frozen=True, slots=True)
@@ -13,6 +26,10 @@ class X(IdentifiedValue[None]):
     version: int
 
 
+@dataclass(kw_only=True, frozen=True, slots=True)
+class Y(IdentifiedValue[None]): ...
+
+
 @fixture
 def x_v1() -> X:
     return X(id=None, version=1)
@@ -80,3 +97,191 @@ def test_dead(x_v1: X, x_v2: X) -> None:
         dead(x_v1) & existing(x_v2)
         == Effect(x_v2, dead_values=IdentifiedValueSet([x_v1]))
     )
+
+
+def test_existing(x_v1: X, x_v2: X) -> None:
+    assert existing(x_v1) & new(x_v2) == new(x_v2)
+    assert existing(x_v1) & translated(x_v2) == translated(x_v2)
+    assert existing(x_v1) & mutated(x_v2) == mutated(x_v2)
+    assert existing(x_v1) & dead(x_v2) == dead(x_v2)
+    assert existing(x_v1) & existing(x_v2) == existing(x_v2)
+
+
+def test_different_values(x_v1: X) -> None:
+    y = Y(id=None)
+
+    assert new(x_v1) & new(y) == Effect(y, new_values=IdentifiedValueSet([x_v1, y]))
+    assert new(x_v1) & dead(y) == Effect(
+        y,
+        new_values=IdentifiedValueSet([x_v1]),
+        dead_values=IdentifiedValueSet([y]),
+    )
+
+
+def test_differently_sized_effects(x_v1: X, x_v2: X) -> None:
+    y = Y(id=None)
+
+    assert (new(x_v1) & new(y)) & dead(x_v2) == Effect(
+        x_v2, new_values=IdentifiedValueSet([y])
+    )
+    assert mutated(x_v1) & (new(y) & dead(x_v2)) == Effect(
+        x_v2,
+        new_values=IdentifiedValueSet([y]),
+        dead_values=IdentifiedValueSet([x_v2]),
+    )
+
+
+def test_of_values_with_state(x_v1: X, x_v2: X) -> None:
+    class SomeNewValue(NewValue[X]): ...
+
+    effect: Effect[int, X, X, X, X] = Effect.of_values_with_state(
+        just=4,
+        values=[SomeNewValue(x_v1), MutatedValue(x_v2), NoValue(x_v2)],
+    )
+
+    assert effect == Effect(
+        4,
+        new_values=IdentifiedValueSet([x_v1]),
+        mutated_values=IdentifiedValueSet([x_v2]),
+    )
+
+
+def test_of_values_with_state_from_iterator(x_v1: X) -> None:
+    values = iter([NewValue(x_v1)])
+    effect: Effect[int, X] = Effect.of_values_with_state(just=4, values=values)
+
+    assert effect == new(x_v1).map(lambda _: 4)
+    assert tuple(values) == tuple()
+
+
+def test_effect_with_value_in_several_sets(x_v1: X) -> None:
+    y = Y(id=None)
+    effect = Effect(
+        x_v1,
+        new_values=IdentifiedValueSet([x_v1]),
+        mutated_values=IdentifiedValueSet([x_v1]),
+    )
+
+    assert effect & existing(y) == Effect(
+        y, new_values=IdentifiedValueSet([x_v1])
+    )
+    assert existing(y) & effect == Effect(
+        x_v1, new_values=IdentifiedValueSet([x_v1])
+    )
+    assert effect & new(y) == Effect(
+        y, new_values=IdentifiedValueSet([x_v1, y])
+    )
+
+
+def test_value_with_state_by_value(x_v1: X, x_v2: X) -> None:
+    assert mutated(x_v1).value_with_state_by_value(x_v2) == MutatedValue(x_v2)
+    assert existing(x_v1).value_with_state_by_value(x_v2) == NoValue(x_v2)
+    assert mutated(x_v1).value_with_state_by_value("x") == NoValue("x")
+
+
+def test_value_with_state_by_identity(x_v1: X, x_v2: X) -> None:
+    assert (
+        mutated(x_v1).value_with_state_by_identity(Identity(x_v2))
+        == MutatedValue(x_v1)
+    )
+    assert (
+        existing(x_v1).value_with_state_by_identity(Identity(x_v2))
+        == NoValue(x_v2)
+    )
+
+
+def test_iter(x_v1: X) -> None:
+    effect = new(x_v1)
+
+    assert tuple(effect) == (x_v1,)
+    assert tuple(effect) == (x_v1,)
+    assert tuple(existing(x_v1)) == tuple()
+
+
+def test_map(x_v1: X) -> None:
+    assert translated(x_v1).map(lambda _: 4) == Effect(
+        4, translated_values=IdentifiedValueSet([x_v1])
+    )
+
+
+def test_and_then(x_v1: X, x_v2: X) -> None:
+    assert translated(x_v1).and_then(existing) == translated(x_v1)
+    assert new(x_v1).and_then(lambda _: mutated(x_v2)) == new(x_v2)
+
+
+def test_and_then_pure(x_v1: X, x_v2: X) -> None:
+    calls = list[X]()
+
+    @pure
+    def mutated_x_v2(x: X) -> Mutated[X]:
+        calls.append(x)
+        return mutated(x_v2)
+
+    effect = new(x_v1)
+
+    assert effect.and_then(mutated_x_v2) == new(x_v2)
+    assert effect.and_then(mutated_x_v2) == new(x_v2)
+    assert calls == [x_v1]
+
+
+def test_and_then_pure_with_equal_values_of_different_types() -> None:
+    @pure
+    def represented(value: object) -> Effect[str]:
+        return Effect(repr(value))
+
+    assert Effect(1).and_then(represented).just == "1"
+    assert Effect(True).and_then(represented).just == "True"
+    assert Effect((1,)).and_then(represented).just == "(1,)"
+    assert Effect((True,)).and_then(represented).just == "(True,)"
+
+
+def test_and_then_pure_with_equal_tracked_values(x_v1: X) -> None:
+    @pure
+    def existing_x(x: X) -> Existing[X]:
+        return existing(x)
+
+    x_v1_as_bool = X(id=None, version=True)
+
+    assert new(x_v1).and_then(existing_x) == new(x_v1)
+
+    effect = new(x_v1_as_bool).and_then(existing_x)
+    [new_x] = effect.new_values
+
+    assert effect.just.version is True
+    assert new_x.version is True
+
+
+def test_pure_bound_method() -> None:
+    class Some:
+        def method(self, value: int) -> Effect[int]:
+            return Effect(value)
+
+    with raises(UnmarkableFunctionError):
+        pure(Some().method)
+
+
+def test_and_then_pure_method_of_unhashable_object(x_v1: X) -> None:
+    @dataclass
+    class Some:
+        @pure
+        def method(self, value: X) -> Mutated[X]:
+            return mutated(value)
+
+    assert new(x_v1).and_then(Some().method) == new(x_v1)
+
+
+def test_fields(x_v1: X) -> None:
+    effect = new(x_v1)
+    fields_before_lookups = astuple(effect)
+
+    tuple(effect)
+    effect.value_with_state_by_value(x_v1)
+
+    assert tuple(field.name for field in fields(effect)) == (
+        "just",
+        "new_values",
+        "translated_values",
+        "mutated_values",
+        "dead_values",
+    )
+    assert astuple(effect) == fields_before_lookups
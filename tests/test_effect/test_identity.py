@@ -0,0 +1,40 @@
+import pickle  # noqa: S403
+from dataclasses import dataclass
+
+from pytest import fixture
+
+from effect.identity import IdentifiedValue, IdentifiedValueSet, Identity
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class X(IdentifiedValue[None]):
+    version: int
+
+
+@fixture
+def x_v1() -> X:
+    return X(id=None, version=1)
+
+
+@fixture
+def x_v2() -> X:
+    return X(id=None, version=2)
+
+
+def test_union_all(x_v1: X, x_v2: X) -> None:
+    union = IdentifiedValueSet[X].union_all(
+        IdentifiedValueSet([x_v1]), IdentifiedValueSet([x_v2])
+    )
+
+    assert tuple(union) == (x_v1,)
+    assert tuple(IdentifiedValueSet[X].union_all()) == tuple()
+
+
+def test_pickled_identity(x_v1: X, x_v2: X) -> None:
+    identity = Identity(x_v1)
+    object.__setattr__(identity, "_hash", hash(identity) + 1)  # noqa: PLC2801
+
+    unpickled_identity = pickle.loads(pickle.dumps(identity))  # noqa: S301
+
+    assert unpickled_identity == identity
+    assert hash(unpickled_identity) == hash(Identity(x_v2))
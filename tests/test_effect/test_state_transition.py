@@ -7,6 +7,7 @@ from effect.state_transition import (
     NewValue,
     NoValue,
     TranslatedValue,
+    ValueWithState,
 )
 
 
@@ -65,3 +66,20 @@ def test_dead(x_v1: str, x_v2: str) -> None:
 
     assert DeadValue(x_v1) & DeadValue(x_v2) == DeadValue(x_v2)
     assert DeadValue(x_v1) & NoValue(x_v2) == DeadValue(x_v1)
+
+
+def test_subclasses(x_v1: str, x_v2: str) -> None:
+    class SomeNewValue(NewValue[str]): ...
+
+    class SomeDeadValue(DeadValue[str]): ...
+
+    assert SomeNewValue(x_v1) & MutatedValue(x_v2) == NewValue(x_v2)
+    assert SomeNewValue(x_v1) & SomeDeadValue(x_v2) == NoValue(x_v2)
+
+    with raises(InvalidStateTransitionError):
+        SomeDeadValue(x_v1) & SomeNewValue(x_v2)
+
+
+def test_abstract_value_with_state() -> None:
+    with raises(TypeError):
+        ValueWithState("x")  # type: ignore[abstract]